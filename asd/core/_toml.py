@@ -0,0 +1,105 @@
+"""TOML parser backend selection.
+
+Prefers a native parser (rtoml, then pytomlpp) when one is installed and
+falls back to the standard library ``tomllib``, which is always available on
+Python 3.12+.
+All backends raise the same ``TOMLDecodeError`` on malformed input.
+
+Serialization always uses ``tomli_w``, so generated files are identical no
+matter which parser is installed. It is imported only when something is
+actually written.
+"""
+
+import importlib
+import tomllib
+from types import ModuleType
+from typing import IO, Any
+
+
+def _import_first(*names: str) -> ModuleType | None:
+    """Import the first available module from a list of candidates.
+
+    Args:
+        names: Module names in order of preference
+
+    Returns:
+        Imported module, or None if none are installed
+    """
+    for name in names:
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+# Native parsers in order of preference; both expose loads()
+_native = _import_first("rtoml", "pytomlpp")
+_native_error: type[Exception] = getattr(
+    _native, "TomlParsingError", getattr(_native, "DecodeError", ValueError)
+)
+
+
+class TOMLDecodeError(ValueError):
+    """Raised when a TOML document cannot be parsed."""
+
+
+def loads(text: str) -> dict[str, Any]:
+    """Parse a TOML document from a string.
+
+    Args:
+        text: TOML document
+
+    Returns:
+        Parsed TOML data
+
+    Raises:
+        TOMLDecodeError: If the document is not valid TOML
+    """
+    try:
+        if _native is not None:
+            data: dict[str, Any] = _native.loads(text)
+        else:
+            data = tomllib.loads(text)
+    except (tomllib.TOMLDecodeError, _native_error) as e:
+        raise TOMLDecodeError(str(e)) from e
+    return data
+
+
+def load(fp: IO[bytes]) -> dict[str, Any]:
+    """Parse a TOML document from a binary file object.
+
+    Args:
+        fp: File opened in binary mode
+
+    Returns:
+        Parsed TOML data
+
+    Raises:
+        TOMLDecodeError: If the document is not valid TOML
+    """
+    return loads(fp.read().decode("utf-8"))
+
+
+def dumps(data: dict[str, Any]) -> str:
+    """Serialize data to a TOML document.
+
+    Args:
+        data: TOML data (strings, numbers, booleans, lists and tables)
+
+    Returns:
+        TOML document
+    """
+    import tomli_w
+
+    return tomli_w.dumps(data)
+
+
+def dump(data: dict[str, Any], fp: IO[bytes]) -> None:
+    """Serialize data to a binary file object as TOML.
+
+    Args:
+        data: TOML data (strings, numbers, booleans, lists and tables)
+        fp: File opened in binary mode
+    """
+    fp.write(dumps(data).encode("utf-8"))
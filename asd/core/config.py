@@ -7,7 +7,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class ParameterType(str, Enum):
@@ -69,6 +69,8 @@ class Parameter(BaseModel):
     expr: str | None = None  # Expression for computed params
     env: str | None = None  # Environment variable name
 
+    _configuration_values: dict[str, Any] | None = PrivateAttr(default=None)
+
     def model_post_init(self, __context: Any) -> None:
         """Auto-infer type from default value if not specified."""
         if self.type is None:
@@ -77,13 +79,16 @@ class Parameter(BaseModel):
     def get_configuration_values(self) -> dict[str, Any]:
         """Get all extra fields as configuration values.
 
+        The result is computed once and shared between calls, so callers
+        must not modify it.
+
         Returns:
             Dictionary mapping configuration name to value
         """
-        # In Pydantic v2, extra fields are stored in __pydantic_extra__
-        if hasattr(self, "__pydantic_extra__") and self.__pydantic_extra__:
-            return dict(self.__pydantic_extra__)
-        return {}
+        if self._configuration_values is None:
+            # In Pydantic v2, extra fields are stored in __pydantic_extra__
+            self._configuration_values = dict(self.__pydantic_extra__ or {})
+        return self._configuration_values
 
     @field_validator("default")
     @classmethod
@@ -137,6 +142,8 @@ class Define(BaseModel):
     type: ParameterType | None = None  # Auto-inferred from default if not specified
     description: str | None = None
 
+    _configuration_values: dict[str, Any] | None = PrivateAttr(default=None)
+
     def model_post_init(self, __context: Any) -> None:
         """Auto-infer type from default value if not specified."""
         if self.type is None:
@@ -145,13 +152,16 @@ class Define(BaseModel):
     def get_configuration_values(self) -> dict[str, Any]:
         """Get all extra fields as configuration values.
 
+        The result is computed once and shared between calls, so callers
+        must not modify it.
+
         Returns:
             Dictionary mapping configuration name to value
         """
-        # In Pydantic v2, extra fields are stored in __pydantic_extra__
-        if hasattr(self, "__pydantic_extra__") and self.__pydantic_extra__:
-            return dict(self.__pydantic_extra__)
-        return {}
+        if self._configuration_values is None:
+            # In Pydantic v2, extra fields are stored in __pydantic_extra__
+            self._configuration_values = dict(self.__pydantic_extra__ or {})
+        return self._configuration_values
 
 
 class Configuration(BaseModel):
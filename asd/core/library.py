@@ -9,10 +9,8 @@ import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
-import tomli
-import tomli_w
-
 from ..utils.logging import get_logger
+from . import _toml
 from .library_config import LibraryManifest, LibrarySpec
 from .repository import Repository
 
@@ -171,7 +169,7 @@ class LibraryManager:
             return LibraryManifest()
 
         with open(self.repo.manifest_path, "rb") as f:
-            data = tomli.load(f)
+            data = _toml.load(f)
 
         # Parse libraries
         libraries: dict[str, LibrarySpec] = {}
@@ -190,7 +188,7 @@ class LibraryManager:
         self.repo.asd_dir.mkdir(parents=True, exist_ok=True)
 
         with open(self.repo.manifest_path, "wb") as f:
-            tomli_w.dump(manifest.to_toml_dict(), f)
+            _toml.dump(manifest.to_toml_dict(), f)
 
     def derive_name_from_url(self, git_url: str) -> str:
         """Derive library name from git URL.
@@ -554,7 +552,7 @@ class DependencyResolver:
         if lib_dir.exists() and lib_manifest.exists():
             # Load library's dependencies
             with open(lib_manifest, "rb") as f:
-                lib_data = tomli.load(f)
+                lib_data = _toml.load(f)
 
             for dep_name, dep_data in lib_data.get("libraries", {}).items():
                 if dep_name not in completed:
@@ -3,10 +3,27 @@
 Handles repository root detection and path resolution.
 """
 
+import glob
 import os
+import stat
 from pathlib import Path
 
 
+def _has_asd_dir(directory: str) -> bool:
+    """Check for a .asd/ directory with a single stat call.
+
+    Args:
+        directory: Directory to check
+
+    Returns:
+        True if directory contains a .asd/ directory
+    """
+    try:
+        return stat.S_ISDIR(os.stat(os.path.join(directory, ".asd")).st_mode)
+    except OSError:
+        return False
+
+
 class Repository:
     """Manages repository root detection and path resolution."""
 
@@ -52,12 +69,13 @@ class Repository:
                 raise FileNotFoundError(f"ASD_ROOT path does not exist: {env_root}")
             return env_path.resolve()
 
-        # Search upwards for .asd/ directory
-        current = Path.cwd()
-        while current != current.parent:
-            if (current / ".asd").is_dir():
-                return current
-            current = current.parent
+        # Search upwards for .asd/ directory. Not cached: proving that no nearer
+        # .asd/ appeared since takes the same stat calls as the search itself.
+        current = os.getcwd()
+        while current != (parent := os.path.dirname(current)):
+            if _has_asd_dir(current):
+                return Path(current)
+            current = parent
 
         # No .asd/ directory found - fail with helpful error
         raise FileNotFoundError(
@@ -105,7 +123,29 @@ class Repository:
             List of matching file paths
         """
         search_dir = self.resolve_path(directory) if directory else self.root
-        return sorted(search_dir.glob(pattern))
+        if "**" in pattern:
+            # pathlib never follows symlinked directories under ** and yields
+            # each path once, even for patterns like **/**/*.sv
+            return sorted(search_dir.glob(pattern))
+
+        # Without **, glob.glob matches the same paths, and it yields plain
+        # strings, so Path objects are only built for the matches
+        matches = glob.glob(pattern, root_dir=search_dir, include_hidden=True)
+        return sorted(search_dir / match for match in matches)
+
+    def _stat(self, path: str | Path) -> os.stat_result | None:
+        """Stat a path relative to repository root.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            Stat result, or None if the path does not exist
+        """
+        try:
+            return os.stat(self.resolve_path(path))
+        except OSError:
+            return None
 
     def exists(self, path: str | Path) -> bool:
         """Check if a path exists relative to repository root.
@@ -116,7 +156,7 @@ class Repository:
         Returns:
             True if path exists
         """
-        return self.resolve_path(path).exists()
+        return self._stat(path) is not None
 
     def is_file(self, path: str | Path) -> bool:
         """Check if path is a file.
@@ -127,8 +167,8 @@ class Repository:
         Returns:
             True if path is a file
         """
-        resolved = self.resolve_path(path)
-        return resolved.exists() and resolved.is_file()
+        st = self._stat(path)
+        return st is not None and stat.S_ISREG(st.st_mode)
 
     def is_dir(self, path: str | Path) -> bool:
         """Check if path is a directory.
@@ -139,8 +179,8 @@ class Repository:
         Returns:
             True if path is a directory
         """
-        resolved = self.resolve_path(path)
-        return resolved.exists() and resolved.is_dir()
+        st = self._stat(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
 
     @property
     def asd_dir(self) -> Path:
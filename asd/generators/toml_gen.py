@@ -1,13 +1,16 @@
 """TOML generation from HDL sources."""
 
-from collections import deque
+import hashlib
+import json
+import os
+import sys
 from pathlib import Path
 from typing import Any
 
-import tomli_w
 from rich.console import Console
 from rich.prompt import Confirm, IntPrompt, Prompt
 
+from ..core import _toml
 from ..core.config import (
     Configuration,
     LintConfig,
@@ -17,12 +20,47 @@ from ..core.config import (
     Parameter,
     ParameterType,
     SimulationConfig,
+    SynthesisConfig,
     TestConfig,
 )
+from ..core.loader import _default_cache_dir
 from ..core.repository import Repository
-from ..utils.verilog_parser import VerilogParser
+from ..utils.logging import get_logger
+from ..utils.verilog_parser import Module, VerilogParser
 
 console = Console()
+logger = get_logger()
+
+# Bump when the layout of the dependency cache changes
+_DEPS_CACHE_VERSION = 1
+
+# File extensions tried, in order, when looking up an instantiated module
+_HDL_EXTENSIONS = (".sv", ".v", ".svh", ".vh")
+
+# Verilog parameter types that do not map to ParameterType.INTEGER
+_PARAM_TYPE_MAP = {
+    "string": ParameterType.STRING,
+    "boolean": ParameterType.BOOLEAN,
+    "real": ParameterType.REAL,
+}
+
+
+def _mtimes(paths: list[Path]) -> dict[str, int | None]:
+    """Get modification times for a dependency cache entry.
+
+    Args:
+        paths: Files or directories
+
+    Returns:
+        Modification time in nanoseconds per path (None if missing)
+    """
+    stamps: dict[str, int | None] = {}
+    for path in paths:
+        try:
+            stamps[str(path)] = os.stat(path).st_mtime_ns
+        except OSError:
+            stamps[str(path)] = None
+    return stamps
 
 
 class TOMLGenerator:
@@ -36,6 +74,18 @@ class TOMLGenerator:
         """
         self.repo = repository
         self.parser = VerilogParser()
+        # Parsed HDL files keyed by resolved path, shared across traversals
+        self._parse_cache: dict[Path, Module] = {}
+        # Repository-relative strings for paths written into generated TOML
+        self._relpath_cache: dict[str | Path, str] = {}
+        # Dependency scan results persisted across runs, one file per
+        # repository in the loader's cache directory (None if disabled)
+        cache_dir = _default_cache_dir()
+        self._deps_cache_file: Path | None = None
+        if cache_dir is not None:
+            digest = hashlib.blake2b(str(repository.root).encode(), digest_size=16).hexdigest()
+            self._deps_cache_file = cache_dir / "deps" / f"{digest}.json"
+        self._deps_cache: dict[str, Any] | None = None
 
     def generate_from_top(self, top_file: Path, scan_deps: bool = True) -> ModuleConfig:
         """Generate TOML from top-level module.
@@ -50,7 +100,7 @@ class TOMLGenerator:
         top_path = self.repo.resolve_path(top_file)
 
         # Parse top module
-        module = self.parser.parse_file(top_path)
+        module = self._parse(top_path)
 
         # Find sources
         sources = self._find_sources(top_path, module, scan_deps)
@@ -70,8 +120,8 @@ class TOMLGenerator:
             top=module.name,
             type=ModuleType.RTL,
             sources=ModuleSources(
-                modules=[str(self.repo.relative_path(s)) for s in sources],
-                includes=[str(self.repo.relative_path(Path(inc))) for inc in module.includes],
+                modules=list(map(self._rel, sources)),
+                includes=list(map(self._rel, module.includes)),
             ),
             parameters=parameters,
             configurations={
@@ -88,6 +138,53 @@ class TOMLGenerator:
 
         return config
 
+    def _parse(self, path: Path) -> Module:
+        """Parse an HDL file, reusing earlier results for the same file.
+
+        Args:
+            path: HDL file path
+
+        Returns:
+            Parsed module
+        """
+        resolved = path.resolve()
+        module = self._parse_cache.get(resolved)
+        if module is None:
+            module = self.parser.parse_file(resolved)
+            self._parse_cache[resolved] = module
+        return module
+
+    def _try_parse(self, path: Path) -> Module | None:
+        """Parse an HDL file found while scanning for dependencies.
+
+        Args:
+            path: HDL file path
+
+        Returns:
+            Parsed module, or None if the file does not parse as a module
+        """
+        try:
+            return self._parse(path)
+        except Exception:
+            # Not a module file, might be package or include
+            return None
+
+    def _rel(self, path: str | Path) -> str:
+        """Convert a path to a repository-relative string, reusing earlier results.
+
+        Args:
+            path: Path to convert (strings are cached as given, so no Path is
+                built for them on a hit)
+
+        Returns:
+            Repository-relative path string, or the path itself if outside the repo
+        """
+        rel = self._relpath_cache.get(path)
+        if rel is None:
+            rel = str(self.repo.relative_path(Path(path)))
+            self._relpath_cache[path] = rel
+        return rel
+
     def _determine_param_type(self, verilog_type: str) -> ParameterType:
         """Convert Verilog type to parameter type.
 
@@ -97,14 +194,7 @@ class TOMLGenerator:
         Returns:
             ASD parameter type
         """
-        if verilog_type == "string":
-            return ParameterType.STRING
-        elif verilog_type == "boolean":
-            return ParameterType.BOOLEAN
-        elif verilog_type == "real":
-            return ParameterType.REAL
-        else:
-            return ParameterType.INTEGER
+        return _PARAM_TYPE_MAP.get(verilog_type, ParameterType.INTEGER)
 
     def _find_sources(self, top_file: Path, module: Any, scan_deps: bool) -> list[Path]:
         """Find all source files.
@@ -118,6 +208,8 @@ class TOMLGenerator:
             List of source file paths
         """
         sources = [top_file]
+        # Mirrors sources for constant-time membership checks
+        sources_set = {top_file}
 
         if not scan_deps:
             return sources
@@ -131,50 +223,134 @@ class TOMLGenerator:
             self.repo.root / "rtl",
         ]
 
+        cached = self._cached_sources(top_file, search_dirs)
+        if cached is not None:
+            return cached
+
+        # Drop missing directories and list the rest once, so probing for a
+        # module file is a set lookup instead of a stat call
+        dir_index: dict[Path, set[str]] = {}
+        for dir_path in search_dirs:
+            if dir_path in dir_index:
+                continue
+            try:
+                with os.scandir(dir_path) as entries:
+                    dir_index[dir_path] = {entry.name for entry in entries}
+            except OSError:
+                # Missing or unreadable directory
+                continue
+
         visited: set[str] = set()
-        to_visit: deque[str] = deque(module.instances)
+        # Names are interned so the visited checks compare by identity
+        level: list[str] = [sys.intern(inst) for inst in module.instances]
 
         # Show progress if we have dependencies to scan
-        if to_visit:
-            console.print(f"[dim]Scanning {len(to_visit)} dependencies...[/dim]")
+        if level:
+            console.print(f"[dim]Scanning {len(level)} dependencies...[/dim]")
+
+        # Breadth-first, one level at a time: a level's files are located in
+        # order, then parsed for the instances that make up the next level
+        while level:
+            found: list[Path] = []
+            for inst in level:
+                if inst in visited:
+                    continue
+                visited.add(inst)
+
+                # Take the first file not yet collected, by directory then extension
+                candidates = [f"{inst}{ext}" for ext in _HDL_EXTENSIONS]
+                pf = next(
+                    (
+                        dir_path / name
+                        for dir_path, names in dir_index.items()
+                        for name in candidates
+                        if name in names and dir_path / name not in sources_set
+                    ),
+                    None,
+                )
+                if pf is not None:
+                    sources.append(pf)
+                    sources_set.add(pf)
+                    found.append(pf)
+
+            # Parse for more dependencies
+            parsed = [self._try_parse(pf) for pf in found]
+            level = [
+                sys.intern(inst) for sub in parsed if sub is not None for inst in sub.instances
+            ]
+
+        self._store_sources(top_file, search_dirs, sources)
+        return sources
 
-        while to_visit:
-            inst = to_visit.popleft()
-            if inst in visited:
-                continue
-            visited.add(inst)
+    def _load_deps_cache(self) -> dict[str, Any]:
+        """Load the persistent dependency cache, once per generator.
 
-            # Try to find module file
-            found = False
-            for dir_path in search_dirs:
-                if not dir_path.exists():
-                    continue
+        Returns:
+            Cached scans keyed by top file (empty if missing or unreadable)
+        """
+        if self._deps_cache is None:
+            self._deps_cache = {}
+            if self._deps_cache_file is not None:
+                try:
+                    with open(self._deps_cache_file, "rb") as f:
+                        data = json.load(f)
+                    if data.get("version") == _DEPS_CACHE_VERSION:
+                        self._deps_cache = data["entries"]
+                except (OSError, ValueError, KeyError, AttributeError) as e:
+                    logger.debug(f"Ignoring dependency cache {self._deps_cache_file}: {e}")
+        return self._deps_cache
+
+    def _cached_sources(self, top_file: Path, search_dirs: list[Path]) -> list[Path] | None:
+        """Get a previous scan's sources if nothing it depended on changed.
+
+        A scan stays valid while every source file and every search directory
+        has the same modification time, so edited files as well as added or
+        removed module files invalidate it.
 
-                possible_files = [
-                    dir_path / f"{inst}.sv",
-                    dir_path / f"{inst}.v",
-                    dir_path / f"{inst}.svh",
-                    dir_path / f"{inst}.vh",
-                ]
-
-                for pf in possible_files:
-                    if pf.exists() and pf not in sources:
-                        sources.append(pf)
-                        found = True
-
-                        # Parse for more dependencies
-                        try:
-                            sub_module = self.parser.parse_file(pf)
-                            to_visit.extend(sub_module.instances)
-                        except Exception:
-                            # Not a module file, might be package or include
-                            pass
-                        break
-
-                if found:
-                    break
+        Args:
+            top_file: Top module file
+            search_dirs: Directories searched for dependencies
 
-        return sources
+        Returns:
+            Source file paths, or None if there is no valid cached scan
+        """
+        entry = self._load_deps_cache().get(str(top_file))
+        if entry is None:
+            return None
+        try:
+            stamps = {**entry["dirs"], **entry["files"]}
+            if stamps != _mtimes([*search_dirs, *map(Path, entry["files"])]):
+                return None
+            return [Path(source) for source in entry["files"]]
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            logger.debug(f"Ignoring malformed dependency cache entry for {top_file}: {e}")
+            return None
+
+    def _store_sources(self, top_file: Path, search_dirs: list[Path], sources: list[Path]) -> None:
+        """Record a scan's sources in the persistent dependency cache.
+
+        The cache is written to a temporary file and renamed into place.
+        Failures are ignored.
+
+        Args:
+            top_file: Top module file
+            search_dirs: Directories searched for dependencies
+            sources: Source file paths found, in order
+        """
+        if self._deps_cache_file is None:
+            return
+        entries = self._load_deps_cache()
+        entries[str(top_file)] = {"dirs": _mtimes(search_dirs), "files": _mtimes(sources)}
+        cache_file = self._deps_cache_file
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump({"version": _DEPS_CACHE_VERSION, "entries": entries}, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write dependency cache {cache_file}: {e}")
+            tmp_file.unlink(missing_ok=True)
 
     def write_toml(self, config: ModuleConfig, output: Path) -> None:
         """Write configuration to TOML file.
@@ -253,7 +429,7 @@ class TOMLGenerator:
 
         # Write file
         with open(output, "wb") as f:
-            tomli_w.dump(data, f)
+            _toml.dump(data, f)
 
     def interactive_generate(self, top_file: Path) -> ModuleConfig:
         """Interactive TOML generation with prompts.
@@ -324,8 +500,6 @@ class TOMLGenerator:
 
         # Ask about synthesis
         if Confirm.ask("Add synthesis configuration?", default=False):
-            from ..core.config import SynthesisConfig
-
             config.synthesis = SynthesisConfig(
                 tool="vivado",
                 configurations=["default"],
@@ -4,27 +4,113 @@ This module provides reusable Driver, Monitor, and Scoreboard classes
 that wrap cocotbext-axi for ergonomic AXI-Stream verification.
 """
 
+import logging
 import random
-from collections import deque
-from collections.abc import Generator
+from array import array
+from collections.abc import Callable, Generator, Iterable, Iterator
+from itertools import chain
 from typing import Any, Literal
 
 import cocotb
 from cocotb.triggers import with_timeout
 from cocotbext.axi import AxiStreamBus, AxiStreamFrame, AxiStreamSink, AxiStreamSource
 
+# Pause decisions drawn per refill of a duty cycle generator
+_DUTY_CYCLE_BATCH = 4096
 
-def _make_duty_cycle_generator(duty_cycle: float) -> Generator[bool, None, None]:
+
+def _duty_cycle_batches(threshold: int) -> Generator[list[bool], None, None]:
+    """Generate batches of pause decisions against a 32-bit threshold.
+
+    One randbytes() call supplies a 32-bit random word per cycle, so a whole
+    batch is drawn at once instead of one random number per cycle.
+
+    Args:
+        threshold: Random words at or above this value pause
+
+    Yields:
+        Lists of pause decisions, True to pause (stall)
+    """
+    while True:
+        words = memoryview(random.randbytes(4 * _DUTY_CYCLE_BATCH)).cast("I")
+        yield [word >= threshold for word in words]
+
+
+def _make_duty_cycle_generator(duty_cycle: float) -> Iterator[bool]:
     """Generate pause pattern for given duty cycle.
 
+    Batches are flattened with chain.from_iterable(), so each clock cycle
+    only advances a list iterator from C and the Python batch generator is
+    resumed once per batch.
+
     Args:
         duty_cycle: Float between 0.0 and 1.0 where 1.0 means always active.
 
+    Returns:
+        Endless iterator of pause decisions, True to pause (stall)
+    """
+    return chain.from_iterable(_duty_cycle_batches(int(duty_cycle * 2**32)))
+
+
+def _make_stall_signal_generator(signal: Any) -> Generator[bool, None, None]:
+    """Generate pause pattern that follows an HDL stall strobe.
+
+    The stall decision is made in HDL (e.g. an LFSR compared against a
+    threshold), so each clock cycle only samples the signal instead of
+    drawing a random number in Python. Unresolved values (X/Z) do not stall.
+
+    Args:
+        signal: Single-bit cocotb signal handle, high to stall
+
     Yields:
         True to pause (stall), False to continue.
     """
     while True:
-        yield random.random() >= duty_cycle
+        yield str(signal.value) == "1"
+
+
+# Buses found by prefix, keyed by (id(dut), prefix); the DUT handle is kept
+# with the bus so the id cannot be reused while the entry exists
+_BUS_CACHE: dict[tuple[int, str], tuple[Any, AxiStreamBus]] = {}
+
+
+def _bus_from_prefix(dut: Any, prefix: str) -> AxiStreamBus:
+    """Look up an AXI-Stream bus by signal prefix, once per DUT and prefix.
+
+    Args:
+        dut: Device under test (cocotb handle)
+        prefix: Bus signal prefix
+
+    Returns:
+        Bus with the signals found under the prefix
+    """
+    key = (id(dut), prefix)
+    cached = _BUS_CACHE.get(key)
+    if cached is not None and cached[0] is dut:
+        return cached[1]
+    bus = AxiStreamBus.from_prefix(dut, prefix)
+    _BUS_CACHE[key] = (dut, bus)
+    return bus
+
+
+def _payload(data: bytes | memoryview | AxiStreamFrame) -> bytes | bytearray | memoryview:
+    """Return the tdata of bytes or a frame without copying when possible.
+
+    bytes, bytearray and memoryview compare equal by content, so byte-oriented
+    frames can be compared in place; other tdata (e.g. lists of words) is copied.
+
+    Args:
+        data: Bytes, memoryview or AxiStreamFrame
+
+    Returns:
+        Payload as bytes, bytearray or memoryview
+    """
+    if not isinstance(data, AxiStreamFrame):
+        return data
+    tdata = data.tdata
+    if isinstance(tdata, bytes | bytearray):
+        return tdata
+    return bytes(tdata)
 
 
 class Driver:
@@ -47,6 +133,8 @@ class Driver:
         await driver.send(b'\x01')  # Uses tid=1, tdest=0
     """
 
+    __slots__ = ("_source", "_clock", "_default_tid", "_default_tdest", "_default_tuser")
+
     def __init__(
         self,
         dut: Any,
@@ -72,7 +160,7 @@ class Driver:
             default_tuser: Default TUSER value for all frames (optional)
         """
         if isinstance(bus, str):
-            bus = AxiStreamBus.from_prefix(dut, bus)
+            bus = _bus_from_prefix(dut, bus)
         self._source = AxiStreamSource(
             bus,
             clock,
@@ -111,19 +199,83 @@ class Driver:
         if isinstance(data, AxiStreamFrame):
             frame = data
         else:
-            # Auto-calculate tkeep if not provided
-            if tkeep is None:
-                tkeep = self._calculate_tkeep(len(data))
-            frame = AxiStreamFrame(
-                tdata=data,
-                tkeep=tkeep,
-                tid=tid if tid is not None else self._default_tid,
-                tdest=tdest if tdest is not None else self._default_tdest,
-                tuser=tuser if tuser is not None else self._default_tuser,
-                tx_complete=tx_complete,
-            )
+            frame = self._build_frame(data, tkeep, tid, tdest, tuser, tx_complete)
         await self._source.send(frame)
 
+    async def send_bytes(
+        self,
+        data: bytes,
+        *,
+        tkeep: bytes | list[int] | None = None,
+        tid: int | None = None,
+        tdest: int | None = None,
+        tuser: int | list[int] | None = None,
+        tx_complete: Any = None,
+    ) -> None:
+        """Send bytes on the AXIS bus as a single frame.
+
+        Same as send() for bytes data, without the frame type check.
+
+        Args:
+            data: Bytes to send
+            tkeep: Byte enable mask (None = all bytes valid)
+            tid: Transaction ID (uses default_tid if None)
+            tdest: Destination ID (uses default_tdest if None)
+            tuser: User sideband data (uses default_tuser if None)
+            tx_complete: Callback event signaled when frame completes
+        """
+        await self._source.send(self._build_frame(data, tkeep, tid, tdest, tuser, tx_complete))
+
+    async def send_many(
+        self,
+        payloads: Iterable[bytes],
+        *,
+        tid: int | None = None,
+        tdest: int | None = None,
+        tuser: int | list[int] | None = None,
+    ) -> None:
+        """Queue several byte payloads on the AXIS bus, one frame each.
+
+        Frames are queued without yielding to the scheduler while the source
+        queue has room; like send(), this returns once all frames are queued,
+        not when they have been transmitted.
+
+        Args:
+            payloads: Byte payloads to send, in order
+            tid: Transaction ID (uses default_tid if None)
+            tdest: Destination ID (uses default_tdest if None)
+            tuser: User sideband data (uses default_tuser if None)
+        """
+        source = self._source
+        for data in payloads:
+            frame = self._build_frame(data, None, tid, tdest, tuser, None)
+            if source.full():
+                await source.send(frame)
+            else:
+                source.send_nowait(frame)
+
+    def _build_frame(
+        self,
+        data: bytes,
+        tkeep: bytes | list[int] | None,
+        tid: int | None,
+        tdest: int | None,
+        tuser: int | list[int] | None,
+        tx_complete: Any,
+    ) -> AxiStreamFrame:
+        """Build a frame from bytes, filling in tkeep and default metadata."""
+        # Auto-calculate tkeep if not provided
+        if tkeep is None:
+            tkeep = self._calculate_tkeep(len(data))
+        return AxiStreamFrame(
+            tdata=data,
+            tkeep=tkeep,
+            tid=tid if tid is not None else self._default_tid,
+            tdest=tdest if tdest is not None else self._default_tdest,
+            tuser=tuser if tuser is not None else self._default_tuser,
+            tx_complete=tx_complete,
+        )
+
     async def wait_idle(self) -> None:
         """Wait until all pending transfers complete."""
         await self._source.wait()
@@ -143,6 +295,17 @@ class Driver:
         else:
             self._source.set_pause_generator(_make_duty_cycle_generator(duty_cycle))
 
+    def bind_stall_signal(self, signal: Any) -> None:
+        """Stall tvalid whenever an HDL strobe signal is high.
+
+        Replaces any duty cycle set with set_duty_cycle(); the testbench HDL
+        decides when to stall and cocotb only samples the strobe.
+
+        Args:
+            signal: Single-bit cocotb signal handle, high to stall
+        """
+        self._source.set_pause_generator(_make_stall_signal_generator(signal))
+
     def _calculate_tkeep(self, data_len: int) -> list[int] | None:
         """Calculate tkeep mask based on data length and bus width.
 
@@ -161,20 +324,9 @@ class Driver:
         if data_len % byte_lanes == 0:
             return None
 
-        # Calculate tkeep for all beats
-        num_beats = (data_len + byte_lanes - 1) // byte_lanes
-        last_beat_valid = data_len % byte_lanes
-
-        tkeep = []
-        for beat_idx in range(num_beats):
-            if beat_idx < num_beats - 1:
-                # Full beat: all bytes valid
-                tkeep.extend([1] * byte_lanes)
-            else:
-                # Last beat: valid bytes at LOW positions [1,1,1,0,0,0]
-                tkeep.extend([1] * last_beat_valid + [0] * (byte_lanes - last_beat_valid))
-
-        return tkeep
+        # Valid bytes at LOW positions of the last beat [1,1,1,0,0,0], so every
+        # data byte is valid and only the padding of the last beat is not
+        return [1] * data_len + [0] * (byte_lanes - data_len % byte_lanes)
 
     @property
     def default_tid(self) -> int | None:
@@ -214,6 +366,8 @@ class Monitor:
     with optional duty cycle control for backpressure simulation.
     """
 
+    __slots__ = ("_sink", "_clock")
+
     def __init__(
         self,
         dut: Any,
@@ -232,7 +386,7 @@ class Monitor:
             reset_active_level: True if reset is active-high, False if active-low
         """
         if isinstance(bus, str):
-            bus = AxiStreamBus.from_prefix(dut, bus)
+            bus = _bus_from_prefix(dut, bus)
         self._sink = AxiStreamSink(
             bus,
             clock,
@@ -282,6 +436,27 @@ class Monitor:
         frame = await self.recv(timeout_ns)
         return bytes(frame.tdata)
 
+    async def recv_view(self, timeout_ns: int | None = None) -> memoryview:
+        """Receive data from the AXIS bus as a read-only view of tdata.
+
+        Unlike recv_bytes(), byte-oriented tdata is not copied. The view can
+        be passed straight to Scoreboard.add_actual() in bytes mode.
+
+        Args:
+            timeout_ns: Timeout in nanoseconds (None for no timeout)
+
+        Returns:
+            Read-only memoryview of the received tdata
+
+        Raises:
+            cocotb.result.SimTimeoutError: If timeout expires
+        """
+        frame = await self.recv(timeout_ns)
+        tdata = frame.tdata
+        if not isinstance(tdata, bytes | bytearray):
+            tdata = bytes(tdata)
+        return memoryview(tdata).toreadonly()
+
     def empty(self) -> bool:
         """Check if receive queue is empty."""
         return bool(self._sink.empty())
@@ -305,18 +480,77 @@ class Monitor:
         else:
             self._sink.set_pause_generator(_make_duty_cycle_generator(duty_cycle))
 
+    def bind_stall_signal(self, signal: Any) -> None:
+        """Stall tready whenever an HDL strobe signal is high.
+
+        Replaces any duty cycle set with set_duty_cycle(); the testbench HDL
+        decides when to apply backpressure and cocotb only samples the strobe.
+
+        Args:
+            signal: Single-bit cocotb signal handle, high to stall
+        """
+        self._sink.set_pause_generator(_make_stall_signal_generator(signal))
+
+
+class _LazyFormat:
+    """Log argument that formats its data only when converted to a string."""
+
+    __slots__ = ("_formatter", "_data")
+
+    def __init__(self, formatter: Callable[[Any], str], data: Any) -> None:
+        self._formatter = formatter
+        self._data = data
+
+    def __str__(self) -> str:
+        return self._formatter(self._data)
+
+
+# Consumed expected entries kept before the scoreboard compacts its queue
+_COMPACT_THRESHOLD = 1024
+
 
 class Scoreboard:
     """Comparison scoreboard for AXI-Stream verification.
 
     Supports both byte-level comparison (simple) and frame-level comparison
     (with tkeep, tid, tdest, tuser metadata).
+
+    In deferred mode, received data is only queued by add_actual() and
+    compared in one pass by flush() (called by check()), logging a summary
+    instead of one line per match.
+
+    Only the first max_errors error messages are formatted and kept; later
+    errors are still counted as mismatches. With fail_fast, the first error
+    raises AssertionError instead.
     """
 
+    __slots__ = (
+        "_name",
+        "_compare_mode",
+        "_compare",
+        "_check_actual",
+        "_format",
+        "_deferred",
+        "_received",
+        "_expected",
+        "_expected_buf",
+        "_expected_ends",
+        "_expected_head",
+        "_matches",
+        "_mismatches",
+        "_errors",
+        "_max_errors",
+        "_fail_fast",
+    )
+
     def __init__(
         self,
         name: str = "Scoreboard",
         compare_mode: Literal["bytes", "frame"] = "bytes",
+        *,
+        deferred: bool = False,
+        max_errors: int = 100,
+        fail_fast: bool = False,
     ) -> None:
         """Initialize the scoreboard.
 
@@ -324,102 +558,302 @@ class Scoreboard:
             name: Name for logging purposes
             compare_mode: "bytes" for tdata-only comparison,
                          "frame" for full metadata comparison
+            deferred: Queue received data and compare it in flush()
+            max_errors: Maximum number of error messages to keep and log
+            fail_fast: Raise AssertionError on the first error
         """
         self._name = name
         self._compare_mode = compare_mode
-        self._expected: deque[bytes | AxiStreamFrame] = deque()
-        self._actual: deque[bytes | AxiStreamFrame] = deque()
+        # Comparison, queue access and formatting specialized once for the
+        # mode instead of per call
+        bytes_mode = compare_mode == "bytes"
+        self._compare: Callable[[bytes | memoryview | AxiStreamFrame, Any], bool] = (
+            self._compare_bytes if bytes_mode else self._compare_frame
+        )
+        self._check_actual: Callable[[bytes | memoryview | AxiStreamFrame, bool], None] = (
+            self._check_bytes if bytes_mode else self._check_frame
+        )
+        self._format: Callable[[bytes | memoryview | AxiStreamFrame], str] = (
+            self._format_bytes if bytes_mode else self._format_frame
+        )
+        self._deferred = deferred
+        # Received data waiting for flush() in deferred mode
+        self._received: list[bytes | memoryview | AxiStreamFrame] = []
+        # FIFO of expected data. Frame mode keeps the entries themselves;
+        # bytes mode only needs payloads, packed back to back in
+        # _expected_buf with each one's end offset in _expected_ends.
+        # Entries before _expected_head are consumed and dropped in bulk once
+        # they make up half the queue.
+        self._expected: list[bytes | memoryview | AxiStreamFrame] = []
+        self._expected_buf = bytearray()
+        self._expected_ends = array("Q")
+        self._expected_head = 0
         self._matches = 0
         self._mismatches = 0
         self._errors: list[str] = []
+        self._max_errors = max_errors
+        self._fail_fast = fail_fast
 
-    def add_expected(self, data: bytes | AxiStreamFrame) -> None:
+    def add_expected(self, data: bytes | memoryview | AxiStreamFrame) -> None:
         """Add expected data to the scoreboard.
 
         Args:
-            data: Expected bytes or AxiStreamFrame
+            data: Expected bytes, memoryview or AxiStreamFrame
         """
-        self._expected.append(data)
+        if self._compare_mode == "bytes":
+            self._expected_buf += _payload(data)
+            self._expected_ends.append(len(self._expected_buf))
+        else:
+            self._expected.append(data)
 
-    def add_actual(self, data: bytes | AxiStreamFrame) -> None:
+    def add_actual(self, data: bytes | memoryview | AxiStreamFrame) -> None:
         """Add actual data to the scoreboard and compare with expected.
 
-        Automatically compares against the next expected value in the queue.
+        Automatically compares against the next expected value in the queue,
+        or queues the data for flush() in deferred mode.
 
         Args:
-            data: Actual received bytes or AxiStreamFrame
+            data: Actual received bytes, memoryview or AxiStreamFrame
         """
-        self._actual.append(data)
+        if self._deferred:
+            self._received.append(data)
+        else:
+            self._check_actual(data, True)
 
-        if self._expected:
-            expected = self._expected.popleft()
-            if self._compare(data, expected):
-                self._matches += 1
-                cocotb.log.info(f"[{self._name}] Match: {self._format(data)}")
-            else:
-                self._mismatches += 1
-                error_msg = (
-                    f"Mismatch: expected {self._format(expected)}, " f"got {self._format(data)}"
-                )
-                self._errors.append(error_msg)
-                cocotb.log.error(f"[{self._name}] {error_msg}")
+    def flush(self) -> None:
+        """Compare all data queued in deferred mode against expected data.
+
+        Mismatches are logged individually; matches only as a summary count.
+        If fail_fast raises, data after the failing entry stays queued.
+        """
+        if not self._received:
+            return
+        received, self._received = self._received, []
+        matches = self._matches
+        done = 0
+        try:
+            for data in received:
+                done += 1
+                self._check_actual(data, False)
+        finally:
+            self._received = received[done:]
+        cocotb.log.info(
+            "[%s] Compared %d frames: %d matched",
+            self._name,
+            len(received),
+            self._matches - matches,
+        )
+
+    def _check_bytes(self, data: bytes | memoryview | AxiStreamFrame, log_match: bool) -> None:
+        """Compare received data with the next packed expected payload and record the result.
+
+        Args:
+            data: Actual received bytes, memoryview or AxiStreamFrame
+            log_match: Log each match at INFO level
+        """
+        head = self._expected_head
+        ends = self._expected_ends
+        count = len(ends)
+        if head >= count:
+            self._error("Unexpected data received: {}", data)
+            return
+
+        try:
+            start = ends[head - 1] if head else 0
+            # Released before the buffer can be resized by compaction
+            with memoryview(self._expected_buf)[start : ends[head]] as view:
+                self._record(data, view, log_match)
+        finally:
+            # Consumed even if fail_fast raised
+            self._expected_head = head + 1
+            self._compact_expected(count)
+
+    def _check_frame(self, data: bytes | memoryview | AxiStreamFrame, log_match: bool) -> None:
+        """Compare received data with the next expected entry and record the result.
+
+        Args:
+            data: Actual received bytes, memoryview or AxiStreamFrame
+            log_match: Log each match at INFO level
+        """
+        head = self._expected_head
+        count = len(self._expected)
+        if head >= count:
+            self._error("Unexpected data received: {}", data)
+            return
+
+        try:
+            self._record(data, self._expected[head], log_match)
+        finally:
+            # Consumed even if fail_fast raised
+            self._expected_head = head + 1
+            self._compact_expected(count)
+
+    def _record(
+        self,
+        data: bytes | memoryview | AxiStreamFrame,
+        expected: bytes | memoryview | AxiStreamFrame,
+        log_match: bool,
+    ) -> None:
+        """Compare received data with its expected value and record the result.
+
+        Args:
+            data: Actual received bytes, memoryview or AxiStreamFrame
+            expected: Expected value
+            log_match: Log each match at INFO level
+        """
+        if self._compare(data, expected):
+            self._matches += 1
+            # Hex-encoding is skipped when INFO is filtered out by the logger,
+            # and deferred until a handler actually emits the record
+            if log_match and cocotb.log.isEnabledFor(logging.INFO):
+                cocotb.log.info("[%s] Match: %s", self._name, _LazyFormat(self._format, data))
         else:
-            self._mismatches += 1
-            error_msg = f"Unexpected data received: {self._format(data)}"
+            self._error("Mismatch: expected {}, got {}", expected, data)
+
+    def _error(
+        self,
+        template: str,
+        *values: bytes | memoryview | AxiStreamFrame,
+        fail_fast: bool = True,
+    ) -> None:
+        """Count a mismatch and record its message while under max_errors.
+
+        Args:
+            template: Error message with one {} placeholder per value
+            values: Data formatted into the message, only if it is recorded
+            fail_fast: Raise here if the scoreboard is in fail_fast mode
+
+        Raises:
+            AssertionError: If fail_fast is set on both the call and the scoreboard
+        """
+        self._mismatches += 1
+        raise_error = fail_fast and self._fail_fast
+        if len(self._errors) < self._max_errors or raise_error:
+            error_msg = template.format(*map(self._format, values))
             self._errors.append(error_msg)
             cocotb.log.error(f"[{self._name}] {error_msg}")
+            if raise_error:
+                raise AssertionError(f"[{self._name}] {error_msg}")
+            if len(self._errors) == self._max_errors:
+                cocotb.log.error(
+                    f"[{self._name}] Error limit ({self._max_errors}) reached, "
+                    "further errors are only counted"
+                )
+
+    def _pending_expected(self) -> list[bytes | memoryview | AxiStreamFrame]:
+        """Get the expected entries not consumed yet."""
+        head = self._expected_head
+        if self._compare_mode != "bytes":
+            return self._expected[head:]
+        buf, ends = self._expected_buf, self._expected_ends
+        pending: list[bytes | memoryview | AxiStreamFrame] = []
+        start = ends[head - 1] if head else 0
+        for end in ends[head:]:
+            pending.append(bytes(buf[start:end]))
+            start = end
+        return pending
+
+    def _compact_expected(self, count: int) -> None:
+        """Drop consumed expected entries once they make up half the queue.
 
-    def _compare(self, actual: bytes | AxiStreamFrame, expected: bytes | AxiStreamFrame) -> bool:
-        """Compare actual vs expected based on compare_mode."""
+        Args:
+            count: Number of expected entries queued, including consumed ones
+        """
+        head = self._expected_head
+        if head < _COMPACT_THRESHOLD or head * 2 < count:
+            return
         if self._compare_mode == "bytes":
-            actual_bytes = bytes(actual.tdata) if isinstance(actual, AxiStreamFrame) else actual
-            expected_bytes = (
-                bytes(expected.tdata) if isinstance(expected, AxiStreamFrame) else expected
-            )
-            return actual_bytes == expected_bytes
+            cut = self._expected_ends[head - 1]
+            del self._expected_buf[:cut]
+            self._expected_ends = array("Q", [end - cut for end in self._expected_ends[head:]])
         else:
-            # Frame mode: compare all fields
-            if not isinstance(actual, AxiStreamFrame):
-                actual = AxiStreamFrame(tdata=actual)
-            if not isinstance(expected, AxiStreamFrame):
-                expected = AxiStreamFrame(tdata=expected)
-
-            return (
-                bytes(actual.tdata) == bytes(expected.tdata)
-                and actual.tkeep == expected.tkeep
-                and actual.tid == expected.tid
-                and actual.tdest == expected.tdest
-                and actual.tuser == expected.tuser
-            )
+            del self._expected[:head]
+        self._expected_head = 0
 
-    def _format(self, data: bytes | AxiStreamFrame) -> str:
-        """Format data for logging."""
-        if isinstance(data, AxiStreamFrame):
-            parts = [f"tdata={bytes(data.tdata).hex()}"]
-            if data.tid is not None:
-                parts.append(f"tid={data.tid}")
-            if data.tdest is not None:
-                parts.append(f"tdest={data.tdest}")
-            if data.tkeep is not None:
-                parts.append(f"tkeep={data.tkeep}")
-            if data.tuser is not None:
-                parts.append(f"tuser={data.tuser}")
-            return f"Frame({', '.join(parts)})"
-        return data.hex()
+    def _reset_expected(self) -> None:
+        """Drop all expected entries."""
+        self._expected.clear()
+        self._expected_buf.clear()
+        self._expected_ends = array("Q")
+        self._expected_head = 0
+
+    @staticmethod
+    def _compare_bytes(actual: bytes | memoryview | AxiStreamFrame, expected: memoryview) -> bool:
+        """Compare actual tdata against an expected payload from the packed queue."""
+        # Reject on length before any non-byte tdata is copied
+        actual_data = actual.tdata if isinstance(actual, AxiStreamFrame) else actual
+        if len(actual_data) != len(expected):
+            return False
+        return _payload(actual) == expected
+
+    @staticmethod
+    def _compare_frame(
+        actual: bytes | memoryview | AxiStreamFrame,
+        expected: bytes | memoryview | AxiStreamFrame,
+    ) -> bool:
+        """Compare actual vs expected including all frame metadata."""
+        if not isinstance(actual, AxiStreamFrame):
+            actual = AxiStreamFrame(tdata=actual)
+        if not isinstance(expected, AxiStreamFrame):
+            expected = AxiStreamFrame(tdata=expected)
+
+        # Cheap metadata first, so most mismatches never touch the payload
+        return (
+            actual.tid == expected.tid
+            and actual.tdest == expected.tdest
+            and actual.tuser == expected.tuser
+            and actual.tkeep == expected.tkeep
+            and _payload(actual) == _payload(expected)
+        )
+
+    @staticmethod
+    def _format_bytes(data: bytes | memoryview | AxiStreamFrame) -> str:
+        """Format data for logging, expecting bytes or a memoryview."""
+        try:
+            return data.hex()
+        except AttributeError:
+            # A frame passed to a bytes-mode scoreboard
+            return Scoreboard._format_frame(data)
+
+    @staticmethod
+    def _format_frame(data: bytes | memoryview | AxiStreamFrame) -> str:
+        """Format data for logging, expecting an AxiStreamFrame."""
+        if not isinstance(data, AxiStreamFrame):
+            return data.hex()
+        tdata = _payload(data).hex()
+        # Most frames carry no sidebands; skip building the parts list
+        if data.tid is None and data.tdest is None and data.tkeep is None and data.tuser is None:
+            return f"Frame(tdata={tdata})"
+        parts = [f"tdata={tdata}"]
+        if data.tid is not None:
+            parts.append(f"tid={data.tid}")
+        if data.tdest is not None:
+            parts.append(f"tdest={data.tdest}")
+        if data.tkeep is not None:
+            parts.append(f"tkeep={data.tkeep}")
+        if data.tuser is not None:
+            parts.append(f"tuser={data.tuser}")
+        return f"Frame({', '.join(parts)})"
 
     def check(self) -> bool:
         """Check if all expected data was received and matched.
 
         Returns:
             True if all matches, no mismatches, and no pending expected data
+
+        Raises:
+            AssertionError: If fail_fast is set and expected data is pending
         """
-        if self._expected:
-            for exp in self._expected:
-                error_msg = f"Expected data not received: {self._format(exp)}"
-                self._errors.append(error_msg)
-                cocotb.log.error(f"[{self._name}] {error_msg}")
-            self._mismatches += len(self._expected)
-            self._expected.clear()
+        self.flush()
+        pending = self._pending_expected()
+        self._reset_expected()
+        # Every missing entry is counted before fail_fast raises
+        for exp in pending:
+            self._error("Expected data not received: {}", exp, fail_fast=False)
+        if pending and self._fail_fast:
+            raise AssertionError(
+                f"[{self._name}] Expected data not received: {len(pending)} entries"
+            )
 
         return self._mismatches == 0
 
@@ -438,13 +872,15 @@ class Scoreboard:
             lines.append("Errors:")
             for error in self._errors:
                 lines.append(f"  - {error}")
+            if self._mismatches > len(self._errors):
+                lines.append(f"  ... {self._mismatches - len(self._errors)} more not recorded")
         lines.append(f"Status: {'PASS' if self._mismatches == 0 else 'FAIL'}")
         return "\n".join(lines)
 
     def clear(self) -> None:
         """Clear all state."""
-        self._expected.clear()
-        self._actual.clear()
+        self._reset_expected()
+        self._received.clear()
         self._matches = 0
         self._mismatches = 0
         self._errors.clear()
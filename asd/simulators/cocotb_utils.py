@@ -4,8 +4,10 @@ These utilities help test files access parameters, defines, and configuration
 information passed from the ASD runner through environment variables.
 """
 
+import copy
 import json
 import os
+from functools import lru_cache
 from typing import Any
 
 
@@ -28,6 +30,21 @@ def get_test_arg(name: str, default: Any = None) -> Any:
     if value_str is None:
         return default
 
+    value = _decode(value_str)
+    # The decoded value is shared, so callers get their own copy of containers
+    return copy.deepcopy(value) if isinstance(value, dict | list) else value
+
+
+@lru_cache(maxsize=64)
+def _decode(value_str: str) -> Any:
+    """Decode a test argument, once per distinct environment value.
+
+    Args:
+        value_str: Raw environment variable value
+
+    Returns:
+        Decoded JSON value, or the string itself if it is not valid JSON
+    """
     try:
         return json.loads(value_str)
     except json.JSONDecodeError:
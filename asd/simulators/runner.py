@@ -272,8 +272,8 @@ class SimulationRunner:
         return SimulationContext(
             config=config,
             configuration=configuration,
-            parameters=composed["parameters"],
-            defines=composed["defines"],
+            parameters=composed.parameters,
+            defines=composed.defines,
             sources=sources,
             includes=includes,
             test_files=test_files,
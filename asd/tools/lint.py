@@ -165,8 +165,8 @@ class Linter:
         # Compose parameters and defines for linting
         composed = self.loader.composer.compose(config, "lint", configuration, param_overrides)
 
-        parameters = composed["parameters"]
-        defines = composed["defines"]
+        parameters = composed.parameters
+        defines = composed.defines
 
         # Prepare source files
         sources = self.source_manager.prepare_sources(config)
@@ -120,8 +120,8 @@ class VivadoSynthesizer:
 
         # Compose parameters and defines
         composed = self.loader.composer.compose(config, "synthesis", configuration, param_overrides)
-        parameters = composed["parameters"]
-        defines = composed["defines"]
+        parameters = composed.parameters
+        defines = composed.defines
 
         # Prepare source files
         sources = self.source_manager.prepare_sources(config)
@@ -1,14 +1,19 @@
 """Safe expression evaluator for parameter expressions.
 
-Replaces eval() with a safer parser that only allows specific operations.
+Replaces eval() of raw text with a safer parser that only allows specific
+operations. Parsed trees that pass the same whitelist are compiled to
+bytecode and run without builtins.
 """
 
 import ast
+import copy
 import math
 import operator
 import re
 from collections.abc import Callable
-from typing import Any
+from functools import lru_cache
+from types import CodeType
+from typing import Any, NamedTuple
 
 # Type aliases for complex type expressions using Python 3.12+ type keyword
 type ASTOperatorType = type[ast.operator] | type[ast.unaryop]
@@ -17,6 +22,112 @@ type OperatorMap = dict[ASTOperatorType, OperatorFunc]
 type FunctionMap = dict[str, OperatorFunc]
 type ContextDict = dict[str, Any]
 
+# ${VAR} references inside expressions
+_VAR_PATTERN = re.compile(r"\$\{(\w+)\}")
+
+# ${VAR} references touching a name, number or another reference; textual
+# substitution merges them into one token (${A}${B} with 1 and 2 gives 12)
+_JOINED_VAR_PATTERN = re.compile(r"[\w.}]\$\{\w+\}|\$\{\w+\}[\w.$]")
+
+# Comparison operators supported in expressions
+_COMPARISONS = (ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq)
+
+# Node types compiled as-is besides calls, operations, comparisons and names
+_COMPILED_NODES = (
+    ast.Expression,
+    ast.Constant,
+    ast.IfExp,
+    ast.Load,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+)
+
+# Prefix for whitelisted function names in compiled expressions, so that a
+# variable with the same name as a function cannot shadow it
+_FUNCTION_PREFIX = "_asd_fn_"
+
+# Maximum number of variable-free expression results kept per evaluator
+_CONSTANT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=1024)
+def _parse_expression(expression: str) -> ast.Expression:
+    """Parse an expression, reusing the AST for repeated expression text.
+
+    Args:
+        expression: Preprocessed expression string
+
+    Returns:
+        Parsed expression AST (shared, must not be mutated)
+    """
+    return ast.parse(expression, mode="eval")
+
+
+class ParsedExpression(NamedTuple):
+    """Expression parsed once with ${VAR} references read as plain names."""
+
+    text: str  # Original expression
+    tree: ast.Expression | None  # None if the expression does not parse
+    substituted: frozenset[str]  # Names written as ${VAR}
+    separate: bool  # Every ${VAR} is its own token, as in the tree
+
+
+@lru_cache(maxsize=1024)
+def parse_expression(expression: str) -> ParsedExpression:
+    """Parse an expression for repeated evaluation.
+
+    Args:
+        expression: Expression string
+
+    Returns:
+        Parsed expression (shared, must not be mutated)
+    """
+    try:
+        tree: ast.Expression | None = _parse_expression(_VAR_PATTERN.sub(r"\1", expression))
+    except SyntaxError:
+        tree = None
+    return ParsedExpression(
+        expression,
+        tree,
+        frozenset(_VAR_PATTERN.findall(expression)),
+        _JOINED_VAR_PATTERN.search(expression) is None,
+    )
+
+
+def referenced_names(expression: str) -> frozenset[str]:
+    """Get the variable names an expression refers to.
+
+    Both ${VAR} and bare VAR references are reported. Function names such
+    as log2 are included too; callers should intersect with known names.
+
+    Args:
+        expression: Expression string
+
+    Returns:
+        Referenced names (empty if the expression does not parse)
+    """
+    tree = parse_expression(expression).tree
+    if tree is None:
+        return frozenset()
+    return frozenset(node.id for node in ast.walk(tree) if isinstance(node, ast.Name))
+
+
+def _is_plain_number(value: Any) -> bool:
+    """Check if a value reads back unchanged when substituted as text.
+
+    Args:
+        value: Context value
+
+    Returns:
+        True for finite, non-negative ints and floats (not bools)
+    """
+    if type(value) is int:
+        return value >= 0
+    if type(value) is float:
+        return value >= 0 and math.isfinite(value)
+    return False
+
 
 class SafeExpressionEvaluator:
     """Safely evaluate mathematical expressions."""
@@ -63,6 +174,25 @@ class SafeExpressionEvaluator:
             context: Dictionary of variable values
         """
         self.context = context or {}
+        # Bytecode compiled from whitelisted pre-parsed expressions, keyed by
+        # text (None if the expression uses constructs only the tree walk reports on)
+        self._compiled: dict[str, CodeType | None] = {}
+        self._globals: dict[str, Any] = {
+            "__builtins__": {},
+            **{_FUNCTION_PREFIX + name: func for name, func in self.FUNCTIONS.items()},
+        }
+        # Results of expressions that reference no variables, keyed by text.
+        # ${VAR} substitution usually leaves only literals, so repeated
+        # compositions with the same values skip the AST walk entirely.
+        self._constant_results: dict[str, Any] = {}
+
+    def set_context(self, context: ContextDict | None) -> None:
+        """Rebind the variable context so one evaluator can be reused.
+
+        Args:
+            context: Dictionary of variable values
+        """
+        self.context = context or {}
 
     def evaluate(self, expression: str) -> Any:
         """Safely evaluate an expression.
@@ -79,15 +209,131 @@ class SafeExpressionEvaluator:
         # First, replace ${VAR} syntax with simple variable names
         expression = self._preprocess_expression(expression)
 
+        if expression in self._constant_results:
+            return self._constant_results[expression]
+
         try:
-            # Parse expression into AST
-            tree = ast.parse(expression, mode="eval")
+            # Parse expression into AST (cached by expression text)
+            tree = _parse_expression(expression)
 
             # Evaluate the AST
-            return self._eval_node(tree.body)
+            result = self._eval_node(tree.body)
         except Exception as e:
             raise ValueError(f"Failed to evaluate expression '{expression}': {e}")
 
+        if not referenced_names(expression) - self.FUNCTIONS.keys():
+            if len(self._constant_results) >= _CONSTANT_CACHE_SIZE:
+                self._constant_results.clear()
+            self._constant_results[expression] = result
+        return result
+
+    def eval_ast(self, tree: ast.Expression) -> Any:
+        """Evaluate a pre-parsed expression against the current context.
+
+        Args:
+            tree: Expression AST, as returned by ast.parse(..., mode="eval")
+
+        Returns:
+            Evaluation result
+
+        Raises:
+            ValueError: If expression contains unsafe operations
+        """
+        try:
+            return self._eval_node(tree.body)
+        except Exception as e:
+            raise ValueError(f"Failed to evaluate expression '{ast.unparse(tree)}': {e}")
+
+    def evaluate_parsed(self, parsed: ParsedExpression) -> Any:
+        """Evaluate an expression parsed by parse_expression().
+
+        The pre-parsed tree is evaluated directly when every ${VAR} is a
+        separate token and its value would be substituted back as the same
+        number. Other expressions (e.g. "${A}${B}" or "${X}e3") and values
+        (strings, bools, negative numbers) go through the textual
+        substitution of evaluate(), which defines the result.
+
+        Args:
+            parsed: Parsed expression
+
+        Returns:
+            Evaluation result
+
+        Raises:
+            ValueError: If expression contains unsafe operations
+        """
+        context = self.context
+        tree = parsed.tree
+        if (
+            tree is None
+            or not parsed.separate
+            or not all(
+                name not in context or _is_plain_number(context[name])
+                for name in parsed.substituted
+            )
+        ):
+            return self.evaluate(parsed.text)
+
+        if parsed.text not in self._compiled:
+            try:
+                self._compiled[parsed.text] = self._compile(tree)
+            except ValueError:
+                # Unsupported construct; the tree walk reports it
+                self._compiled[parsed.text] = None
+        code = self._compiled[parsed.text]
+        try:
+            if code is None:
+                return self._eval_node(tree.body)
+            return eval(code, self._globals, context)
+        except NameError as e:
+            raise ValueError(
+                f"Failed to evaluate expression '{parsed.text}': Unknown variable: {e.name}"
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to evaluate expression '{parsed.text}': {e}")
+
+    def _compile(self, tree: ast.Expression) -> CodeType:
+        """Compile a whitelisted expression to bytecode.
+
+        Every node is checked against the constructs _eval_node accepts before
+        compiling, and function names are rewritten to prefixed globals, so
+        running the code can only do what the tree walk would.
+
+        Args:
+            tree: Expression AST (not modified)
+
+        Returns:
+            Code object for eval() with self._globals and a context mapping
+
+        Raises:
+            ValueError: If the expression uses constructs that are not allowed
+        """
+        tree = copy.deepcopy(tree)
+        functions: list[ast.Name] = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in self.FUNCTIONS:
+                    raise ValueError("Function not allowed")
+                if node.keywords:
+                    raise ValueError("Keyword arguments not supported")
+                functions.append(node.func)
+            elif isinstance(node, ast.BinOp | ast.UnaryOp):
+                if type(node.op) not in self.OPERATORS:
+                    raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+            elif isinstance(node, ast.Compare):
+                if len(node.ops) != 1 or not isinstance(node.ops[0], _COMPARISONS):
+                    raise ValueError("Unsupported comparison")
+            elif isinstance(node, ast.Name):
+                # Globals of the compiled code must not be reachable as variables
+                if node.id.startswith(_FUNCTION_PREFIX) or node.id in self._globals:
+                    raise ValueError(f"Unknown variable: {node.id}")
+            elif not isinstance(node, _COMPILED_NODES):
+                raise ValueError(f"Unsupported expression type: {type(node).__name__}")
+        # Renamed after the walk, which would otherwise reject the new names
+        for name in functions:
+            name.id = _FUNCTION_PREFIX + name.id
+        return compile(tree, "<expression>", "eval")
+
     def _preprocess_expression(self, expr: str) -> str:
         """Preprocess expression to replace ${VAR} with VAR.
 
@@ -110,7 +356,7 @@ class SafeExpressionEvaluator:
                 return str(value)
             return var_name
 
-        return re.sub(r"\$\{(\w+)\}", replace_var, expr)
+        return _VAR_PATTERN.sub(replace_var, expr)
 
     def _eval_node(self, node: ast.AST) -> Any:
         """Recursively evaluate an AST node.
@@ -7,13 +7,24 @@ from typing import Any
 
 from ..core.config import Parameter, ParameterType
 
+# Compiled checks for one parameter: (name, type, range, allowed values)
+type ValidationRule = tuple[str, ParameterType | None, tuple[int, int] | None, list[Any] | None]
+
 
 class ParameterValidator:
     """Validate parameter values against their definitions."""
 
+    def __init__(self) -> None:
+        """Initialize validator with an empty rule cache."""
+        # Rules keyed by identity of the definitions mapping. The mapping is kept
+        # alongside its rules so a recycled id can never match a different table.
+        self._rules_cache: dict[int, tuple[dict[str, Parameter], list[ValidationRule]]] = {}
+
     def validate(self, parameters: dict[str, Any], definitions: dict[str, Parameter]) -> list[str]:
         """Validate parameter values against definitions.
 
+        Unknown parameters are allowed and skipped.
+
         Args:
             parameters: Parameter values to validate
             definitions: Parameter definitions with constraints
@@ -23,35 +34,57 @@ class ParameterValidator:
         """
         errors = []
 
-        for name, value in parameters.items():
-            # Check if parameter is defined
-            if name not in definitions:
-                # Warning only - unknown parameters are allowed
+        for name, param_type, value_range, allowed_values in self._compile_rules(definitions):
+            if name not in parameters:
                 continue
-
-            definition = definitions[name]
+            value = parameters[name]
 
             # Validate type
-            if definition.type is not None:
-                type_error = self._validate_type(name, value, definition.type)
+            if param_type is not None:
+                type_error = self._validate_type(name, value, param_type)
                 if type_error:
                     errors.append(type_error)
                     continue  # Skip further validation if type is wrong
 
             # Validate range
-            if definition.range:
-                range_error = self._validate_range(name, value, definition.range)
+            if value_range:
+                range_error = self._validate_range(name, value, value_range)
                 if range_error:
                     errors.append(range_error)
 
             # Validate allowed values
-            if definition.values:
-                values_error = self._validate_values(name, value, definition.values)
+            if allowed_values:
+                values_error = self._validate_values(name, value, allowed_values)
                 if values_error:
                     errors.append(values_error)
 
         return errors
 
+    def _compile_rules(self, definitions: dict[str, Parameter]) -> list[ValidationRule]:
+        """Flatten parameter definitions into validation rules, once per table.
+
+        Definitions are treated as immutable once loaded, so repeated
+        validation against the same module skips attribute access on every
+        Parameter model.
+
+        Args:
+            definitions: Parameter definitions with constraints
+
+        Returns:
+            Rules for parameters that declare at least one constraint
+        """
+        cached = self._rules_cache.get(id(definitions))
+        if cached is not None and cached[0] is definitions:
+            return cached[1]
+
+        rules: list[ValidationRule] = [
+            (name, d.type, d.range, d.values)
+            for name, d in definitions.items()
+            if d.type is not None or d.range or d.values
+        ]
+        self._rules_cache[id(definitions)] = (definitions, rules)
+        return rules
+
     def _validate_type(self, name: str, value: Any, expected_type: ParameterType) -> str | None:
         """Validate parameter type.
 
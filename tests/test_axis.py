@@ -0,0 +1,172 @@
+"""Unit tests for the AXI-Stream scoreboard."""
+
+import logging
+from typing import Literal
+
+import pytest
+
+cocotb = pytest.importorskip("cocotb")
+pytest.importorskip("cocotbext.axi")
+
+from cocotbext.axi import AxiStreamFrame  # noqa: E402
+
+from asd.sims.axis import _COMPACT_THRESHOLD, Scoreboard  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def log(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    """Route scoreboard logging to a captured logger outside a simulation."""
+    monkeypatch.setattr(cocotb, "log", logging.getLogger("test_axis"), raising=False)
+    caplog.set_level(logging.INFO, logger="test_axis")
+
+
+def test_max_errors_truncates_recorded_errors(caplog: pytest.LogCaptureFixture) -> None:
+    """Test errors past max_errors are counted but not recorded or logged."""
+    scoreboard = Scoreboard("SB", max_errors=2)
+    for value in range(5):
+        scoreboard.add_actual(bytes([value]))
+
+    assert scoreboard.mismatches == 5
+    assert not scoreboard.check()
+    assert scoreboard.report().splitlines()[3:] == [
+        "Errors:",
+        "  - Unexpected data received: 00",
+        "  - Unexpected data received: 01",
+        "  ... 3 more not recorded",
+        "Status: FAIL",
+    ]
+    errors = [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR]
+    assert errors[-1] == "[SB] Error limit (2) reached, further errors are only counted"
+    assert len(errors) == 3
+
+
+def test_fail_fast_raises_and_keeps_queues_consistent() -> None:
+    """Test fail_fast raises on a mismatch and the failing entry is consumed."""
+    scoreboard = Scoreboard("SB", fail_fast=True)
+    for payload in (b"\x01", b"\x02", b"\x03"):
+        scoreboard.add_expected(payload)
+
+    with pytest.raises(AssertionError, match=r"\[SB\] Mismatch: expected 01, got ff"):
+        scoreboard.add_actual(b"\xff")
+
+    scoreboard.add_actual(b"\x02")
+    scoreboard.add_actual(b"\x03")
+    assert (scoreboard.matches, scoreboard.mismatches) == (2, 1)
+    assert not scoreboard.check()
+
+
+def test_fail_fast_deferred_keeps_unprocessed_data() -> None:
+    """Test data queued after a fail_fast error is compared by the next flush()."""
+    scoreboard = Scoreboard("SB", deferred=True, fail_fast=True)
+    for payload in (b"\x01", b"\x02", b"\x03"):
+        scoreboard.add_expected(payload)
+        scoreboard.add_actual(b"\xff" if payload == b"\x01" else payload)
+
+    with pytest.raises(AssertionError):
+        scoreboard.flush()
+    assert scoreboard.mismatches == 1
+
+    scoreboard.flush()
+    assert scoreboard.matches == 2
+
+
+def test_fail_fast_check_counts_all_pending() -> None:
+    """Test check() counts every pending entry and clears them before raising."""
+    scoreboard = Scoreboard("SB", fail_fast=True)
+    scoreboard.add_expected(b"\x01")
+    scoreboard.add_expected(b"\x02")
+
+    with pytest.raises(AssertionError, match="Expected data not received: 2 entries"):
+        scoreboard.check()
+    assert scoreboard.mismatches == 2
+    assert scoreboard.report().splitlines()[4:6] == [
+        "  - Expected data not received: 01",
+        "  - Expected data not received: 02",
+    ]
+
+    scoreboard.add_expected(b"\x03")
+    scoreboard.add_actual(b"\x03")
+    assert scoreboard.matches == 1
+
+
+def test_deferred_compares_on_flush_in_order(caplog: pytest.LogCaptureFixture) -> None:
+    """Test deferred data is only compared by flush(), in arrival order."""
+    scoreboard = Scoreboard("SB", deferred=True)
+    scoreboard.add_actual(b"\x01")
+    scoreboard.add_expected(b"\x01")
+    scoreboard.add_expected(b"\x02")
+    scoreboard.add_actual(b"\x03")
+    assert (scoreboard.matches, scoreboard.mismatches) == (0, 0)
+
+    scoreboard.flush()
+
+    assert (scoreboard.matches, scoreboard.mismatches) == (1, 1)
+    messages = [r.getMessage() for r in caplog.records]
+    assert "[SB] Mismatch: expected 02, got 03" in messages
+    assert messages[-1] == "[SB] Compared 2 frames: 1 matched"
+    assert not any("Match:" in message for message in messages)
+
+
+def test_deferred_check_flushes_queued_data(caplog: pytest.LogCaptureFixture) -> None:
+    """Test check() compares queued data before reporting pending entries."""
+    scoreboard = Scoreboard("SB", deferred=True)
+    for payload in (b"\x01", b"\x02", b"\x03"):
+        scoreboard.add_expected(payload)
+    scoreboard.add_actual(b"\x01")
+    scoreboard.add_actual(b"\x02")
+
+    assert not scoreboard.check()
+    assert (scoreboard.matches, scoreboard.mismatches) == (2, 1)
+    messages = [r.getMessage() for r in caplog.records]
+    assert messages[-2:] == [
+        "[SB] Compared 2 frames: 2 matched",
+        "[SB] Expected data not received: 03",
+    ]
+
+    # Nothing left queued, so a second flush() logs no summary
+    scoreboard.flush()
+    assert len(caplog.records) == len(messages)
+
+
+@pytest.mark.parametrize("compare_mode", ["bytes", "frame"])
+def test_expected_queue_survives_compaction(compare_mode: Literal["bytes", "frame"]) -> None:
+    """Test long queues keep FIFO order across compaction, with pending entries."""
+    count = 3 * _COMPACT_THRESHOLD
+    payloads = [bytes([i % 256]) * (i % 5) for i in range(count)]
+    scoreboard = Scoreboard("SB", compare_mode)
+    for payload in payloads:
+        scoreboard.add_expected(payload)
+
+    for i, payload in enumerate(payloads[:-2]):
+        if i == 6:
+            payload += b"\xee"
+        elif i == 2001:
+            payload = b"\xee"
+        scoreboard.add_actual(payload)
+    # Consumed entries were dropped once they made up half the queue
+    assert scoreboard._expected_head < count - 2
+    scoreboard.add_expected(b"\x12\x34")
+
+    assert not scoreboard.check()
+    assert (scoreboard.matches, scoreboard.mismatches) == (count - 4, 5)
+    assert scoreboard.report().splitlines()[3:] == [
+        "Errors:",
+        "  - Mismatch: expected 06, got 06ee",
+        "  - Mismatch: expected d1, got ee",
+        "  - Expected data not received: ",
+        "  - Expected data not received: ff",
+        "  - Expected data not received: 1234",
+        "Status: FAIL",
+    ]
+
+
+@pytest.mark.parametrize("compare_mode", ["bytes", "frame"])
+def test_errors_format_bytes_and_frames(compare_mode: Literal["bytes", "frame"]) -> None:
+    """Test either mode formats both bytes and frames in its error messages."""
+    scoreboard = Scoreboard("SB", compare_mode)
+    scoreboard.add_expected(b"\x01")
+    scoreboard.add_actual(AxiStreamFrame(tdata=b"\x02", tid=3))
+
+    assert scoreboard.report().splitlines()[4] == (
+        "  - Mismatch: expected 01, got Frame(tdata=02, tid=3)"
+    )
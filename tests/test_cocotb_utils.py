@@ -0,0 +1,29 @@
+"""Unit tests for cocotb test argument helpers."""
+
+import json
+
+import pytest
+
+pytest.importorskip("cocotb_tools")
+
+from asd.simulators.cocotb_utils import get_test_arg  # noqa: E402
+
+
+def test_get_test_arg_returns_independent_nested_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test mutating a nested value does not change later results."""
+    monkeypatch.setenv("COCOTB_TEST_VAR_CFG", json.dumps({"lanes": [1, 2], "opts": {"a": 1}}))
+
+    first = get_test_arg("cfg")
+    first["lanes"].append(3)
+    first["opts"]["b"] = 2
+
+    assert get_test_arg("cfg") == {"lanes": [1, 2], "opts": {"a": 1}}
+
+
+def test_get_test_arg_default_and_plain_string(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test missing arguments return the default and non-JSON values stay strings."""
+    monkeypatch.delenv("COCOTB_TEST_VAR_MISSING", raising=False)
+    monkeypatch.setenv("COCOTB_TEST_VAR_NAME", "wide")
+
+    assert get_test_arg("missing", 7) == 7
+    assert get_test_arg("name") == "wide"
@@ -0,0 +1,90 @@
+"""Unit tests for the safe expression evaluator."""
+
+import pytest
+
+from asd.utils.expression import SafeExpressionEvaluator, parse_expression
+
+
+@pytest.mark.parametrize(
+    ("expression", "context"),
+    [
+        ("${A} * ${B} + 1", {"A": 3, "B": 4}),
+        ("${A}${B}", {"A": 1, "B": 2}),
+        ("${X}e3", {"X": 5}),
+        ("1.${X}", {"X": 5}),
+        ("${A} ** 2", {"A": -3}),
+        ("log2(${WIDTH}) if ${WIDTH} > 1 else 1", {"WIDTH": 64}),
+        ("WIDTH // 8", {"WIDTH": 32}),
+    ],
+)
+def test_evaluate_parsed_matches_evaluate(expression: str, context: dict[str, int]) -> None:
+    """Test pre-parsed evaluation gives the same result as textual substitution."""
+    evaluator = SafeExpressionEvaluator(context)
+    expected = evaluator.evaluate(expression)
+
+    assert evaluator.evaluate_parsed(parse_expression(expression)) == expected
+    # Second call runs the cached bytecode
+    assert evaluator.evaluate_parsed(parse_expression(expression)) == expected
+
+
+def test_evaluate_parsed_error_shows_original_text() -> None:
+    """Test errors quote the expression as written, not as re-parsed."""
+    evaluator = SafeExpressionEvaluator({"A": 1})
+
+    with pytest.raises(ValueError, match=r"'\$\{A\} \+ MISSING': Unknown variable: MISSING"):
+        evaluator.evaluate_parsed(parse_expression("${A} + MISSING"))
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "A.real",
+        "A.__class__",
+        "(lambda: A)()",
+        "[x for x in (A, A)]",
+        "{x: x for x in (A,)}",
+        "round(A, ndigits=1)",
+        "max(*(A, A))",
+        "1 < A < 3",
+        "A in (1, 2)",
+        "open('f')",
+        "_asd_fn_log2(A)",
+        "_asd_fn_log2",
+        "__builtins__",
+        "A[0]",
+        "(A := 1)",
+        "A and A",
+    ],
+)
+def test_compile_rejects_what_tree_walk_rejects(expression: str) -> None:
+    """Test the bytecode whitelist refuses every construct the tree walk refuses."""
+    evaluator = SafeExpressionEvaluator({"A": 2})
+    parsed = parse_expression(expression)
+    assert parsed.tree is not None
+
+    with pytest.raises(ValueError):
+        evaluator.eval_ast(parsed.tree)
+    with pytest.raises(ValueError):
+        evaluator._compile(parsed.tree)
+    with pytest.raises(ValueError):
+        evaluator.evaluate_parsed(parsed)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "-A + ~A ** 2 % 3",
+        "A << 2 | A >> 1 ^ A & 3",
+        "A / 3 if A != 2 else A // 3",
+        "min(A, 3) <= max(A, sqrt(A))",
+        "ceil(log(A) * 10) == floor(log10(A) * 10)",
+    ],
+)
+def test_compile_accepts_what_tree_walk_accepts(expression: str) -> None:
+    """Test compiled bytecode agrees with the tree walk on allowed constructs."""
+    evaluator = SafeExpressionEvaluator({"A": 7})
+    parsed = parse_expression(expression)
+    assert parsed.tree is not None
+
+    evaluator._compile(parsed.tree)
+    assert evaluator.evaluate_parsed(parsed) == evaluator.eval_ast(parsed.tree)
@@ -0,0 +1,220 @@
+"""Unit tests for TOML loading and configuration composition."""
+
+from pathlib import Path
+
+import pytest
+
+from asd.core import loader as loader_module
+from asd.core.loader import CircularDependencyError, TOMLLoader
+from asd.core.repository import Repository
+
+MODULE_TOML = """
+[module]
+name = "counter"
+top = "counter"
+
+[module.sources]
+modules = ["rtl/counter.sv"]
+
+[parameters.WIDTH]
+default = 8
+wide = 16
+
+[parameters.DEPTH]
+default = 4
+
+[defines.DEBUG]
+default = false
+debug = true
+
+[configurations.wider]
+inherit = "wide"
+parameters = { DEPTH = 32 }
+
+[configurations.widest]
+inherit = "wider"
+parameters = { WIDTH = 64 }
+
+[tools.simulation]
+configurations = ["all"]
+"""
+
+
+@pytest.fixture
+def loader(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TOMLLoader:
+    """Create a loader rooted at a temporary repository."""
+    monkeypatch.setenv("ASD_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / ".asd").mkdir()
+    return TOMLLoader(Repository(root=tmp_path))
+
+
+def write_toml(loader: TOMLLoader, content: str, name: str = "counter.toml") -> Path:
+    """Write TOML content into the loader's repository."""
+    path = loader.repo.root / name
+    path.write_text(content)
+    return path
+
+
+def test_load_inline_configurations(loader: TOMLLoader) -> None:
+    """Test inline parameter and define values become configurations."""
+    config = loader.load(write_toml(loader, MODULE_TOML))
+
+    assert set(config.configurations) == {"default", "wide", "debug", "wider", "widest"}
+    assert config.configurations["wide"].parameters == {"WIDTH": 16}
+    assert config.configurations["debug"].defines == {"DEBUG": True}
+
+
+def test_compose_inheritance_chain(loader: TOMLLoader) -> None:
+    """Test configurations apply ancestors first so children win."""
+    config = loader.load(write_toml(loader, MODULE_TOML))
+
+    composed = loader.composer.compose(config, "simulation", "widest")
+    assert composed.parameters == {"WIDTH": 64, "DEPTH": 32}
+
+    composed = loader.composer.compose(config, "simulation", "wider")
+    assert composed.parameters == {"WIDTH": 16, "DEPTH": 32}
+
+
+def test_compose_inheritance_cycle_terminates(loader: TOMLLoader) -> None:
+    """Test cyclic inherit chains stop instead of recursing forever."""
+    content = MODULE_TOML.replace('inherit = "wide"', 'inherit = "widest"')
+    config = loader.load(write_toml(loader, content))
+
+    composed = loader.composer.compose(config, "simulation", "widest")
+    assert composed.parameters == {"WIDTH": 64, "DEPTH": 32}
+
+
+def test_compose_cli_overrides_win(loader: TOMLLoader) -> None:
+    """Test CLI overrides take precedence over configurations."""
+    config = loader.load(write_toml(loader, MODULE_TOML))
+
+    composed = loader.composer.compose(config, "simulation", "wide", {"WIDTH": 12})
+    assert composed.parameters["WIDTH"] == 12
+
+
+def test_compose_expressions_in_dependency_order(loader: TOMLLoader) -> None:
+    """Test expressions see values computed by expressions defined later."""
+    content = MODULE_TOML + """
+[parameters.BYTES]
+default = 0
+expr = "${BITS} // 8"
+
+[parameters.BITS]
+default = 0
+expr = "${WIDTH} * ${DEPTH}"
+"""
+    config = loader.load(write_toml(loader, content))
+
+    composed = loader.composer.compose(config, "simulation", "wider")
+    assert composed.parameters["BITS"] == 16 * 32
+    assert composed.parameters["BYTES"] == 16 * 32 // 8
+
+
+def test_compose_expression_cycle_raises(loader: TOMLLoader) -> None:
+    """Test mutually referencing expressions are reported instead of half-evaluated."""
+    content = MODULE_TOML + """
+[parameters.A]
+default = 1
+expr = "B + 1"
+
+[parameters.B]
+default = 1
+expr = "A + 1"
+"""
+    config = loader.load(write_toml(loader, content))
+
+    with pytest.raises(ValueError, match="Circular parameter expressions: A, B"):
+        loader.composer.compose(config, "simulation")
+
+
+def test_circular_dependency_error_message() -> None:
+    """Test the cycle path is formatted from the loading stack."""
+    error = CircularDependencyError([Path("a.toml"), Path("b.toml")], Path("a.toml"))
+    assert str(error) == "Circular dependency: a.toml -> b.toml -> a.toml"
+
+
+def test_prefetch_populates_cache(loader: TOMLLoader) -> None:
+    """Test prefetched files are served from the cache by load()."""
+    first = write_toml(loader, MODULE_TOML, "first.toml")
+    second = write_toml(loader, MODULE_TOML.replace('"counter"', '"other"'), "second.toml")
+
+    loader.prefetch([first, second, first])
+
+    assert loader.load(first).name == "counter"
+    assert loader.load(second).name == "other"
+    assert loader.load(first) is loader.load("first.toml")
+
+
+def test_load_many_preserves_order(loader: TOMLLoader) -> None:
+    """Test load_many returns one configuration per path, in order."""
+    first = write_toml(loader, MODULE_TOML, "first.toml")
+    second = write_toml(loader, MODULE_TOML.replace('"counter"', '"other"'), "second.toml")
+
+    configs = loader.load_many([second, first, "second.toml"])
+
+    assert [config.name for config in configs] == ["other", "counter", "other"]
+    assert configs[0] is configs[2]
+
+
+def test_prefetch_missing_file_raises(loader: TOMLLoader) -> None:
+    """Test prefetch reports unreadable files like load()."""
+    with pytest.raises(FileNotFoundError, match="TOML file not found"):
+        loader.prefetch(["missing.toml"])
+
+
+def test_disk_cache_shared_across_loaders(loader: TOMLLoader) -> None:
+    """Test a fresh loader reuses the persistent cache until the file changes."""
+    path = write_toml(loader, MODULE_TOML)
+    loader.load(path)
+    assert len(list((loader.repo.root / "cache").glob("*.pkl"))) == 1
+
+    fresh = TOMLLoader(loader.repo)
+    assert fresh.load(path).configurations["wide"].parameters == {"WIDTH": 16}
+
+    path.write_text(MODULE_TOML.replace("wide = 16", "wide = 24"))
+    fresh = TOMLLoader(loader.repo)
+    assert fresh.load(path).configurations["wide"].parameters == {"WIDTH": 24}
+    assert len(list((loader.repo.root / "cache").glob("*.pkl"))) == 1
+
+
+def test_disk_cache_ignores_other_releases(
+    loader: TOMLLoader, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test entries written under another cache tag are misses and get replaced."""
+    path = write_toml(loader, MODULE_TOML)
+    loader.load(path)
+
+    monkeypatch.setattr(loader_module, "_DISK_CACHE_TAG", "0/0.0.0/0.0.0")
+    fresh = TOMLLoader(loader.repo)
+    assert fresh._read_disk_cache(fresh._disk_cache_entry(path)) is None
+    assert fresh.load(path).configurations["wide"].parameters == {"WIDTH": 16}
+    assert fresh._read_disk_cache(fresh._disk_cache_entry(path)) is not None
+
+
+def test_disk_cache_corrupt_entry_is_a_miss(loader: TOMLLoader) -> None:
+    """Test unreadable cache files fall back to parsing the TOML file."""
+    path = write_toml(loader, MODULE_TOML)
+    loader.load(path)
+    (entry,) = (loader.repo.root / "cache").glob("*.pkl")
+    entry.write_bytes(b"\x80\x05not a pickle")
+
+    fresh = TOMLLoader(loader.repo)
+    assert fresh.load(path).configurations["wide"].parameters == {"WIDTH": 16}
+
+
+def test_save_round_trip(loader: TOMLLoader) -> None:
+    """Test a saved configuration loads back with the same contents."""
+    config = loader.load(write_toml(loader, MODULE_TOML))
+    loader.save(config, "saved.toml")
+
+    reloaded = TOMLLoader(loader.repo).load("saved.toml")
+    assert reloaded.parameters == config.parameters
+    assert reloaded.configurations.keys() == config.configurations.keys()
+
+
+def test_load_large_file(loader: TOMLLoader) -> None:
+    """Test files above the memory-map threshold load like small ones."""
+    content = MODULE_TOML + "# padding\n" * 10_000
+    config = loader.load(write_toml(loader, content))
+
+    assert config.configurations["wide"].parameters == {"WIDTH": 16}
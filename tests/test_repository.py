@@ -27,6 +27,19 @@ def test_find_root_with_env_var(tmp_path, monkeypatch):
     assert repo.root == tmp_path
 
 
+def test_find_root_sees_nearer_asd_dir(tmp_path, monkeypatch):
+    """Test the upward search finds a .asd/ directory created after a lookup."""
+    monkeypatch.delenv("ASD_ROOT", raising=False)
+    (tmp_path / ".asd").mkdir()
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    monkeypatch.chdir(sub)
+    assert Repository().root == tmp_path
+
+    (sub / ".asd").mkdir()
+    assert Repository().root == sub
+
+
 def test_resolve_path(tmp_path):
     """Test path resolution."""
     repo = Repository(root=tmp_path)
@@ -102,6 +115,27 @@ def test_find_files(tmp_path):
     assert len(src_files) == 3
 
 
+def test_find_files_repeated_double_star(tmp_path):
+    """Test repeated ** segments return each file once."""
+    repo = Repository(root=tmp_path)
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "y.sv").touch()
+    (tmp_path / "a" / "b" / "z.sv").touch()
+
+    assert repo.find_files("**/**/*.sv") == [tmp_path / "a" / "b" / "z.sv", tmp_path / "a" / "y.sv"]
+
+
+def test_find_files_skips_symlinked_dirs(tmp_path):
+    """Test ** does not descend into symlinked directories."""
+    repo = Repository(root=tmp_path)
+    (tmp_path / "rtl").mkdir()
+    (tmp_path / "rtl" / "top.sv").touch()
+    # Loop back to the root; following it would recurse forever
+    (tmp_path / "rtl" / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+    assert repo.find_files("**/*.sv") == [tmp_path / "rtl" / "top.sv"]
+
+
 def test_asd_dir_property(tmp_path):
     """Test asd_dir property returns correct path."""
     repo = Repository(root=tmp_path)
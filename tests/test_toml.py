@@ -0,0 +1,25 @@
+"""Unit tests for the TOML backend shim."""
+
+import tomllib
+from types import SimpleNamespace
+
+import pytest
+import tomli_w
+
+from asd.core import _toml
+
+
+def test_dumps_ignores_native_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test output always comes from tomli_w, whichever parser is installed."""
+    native = SimpleNamespace(loads=tomllib.loads, dumps=lambda data: "native")
+    monkeypatch.setattr(_toml, "_native", native)
+    data = {"module": {"name": "counter", "sources": {"modules": ["rtl/counter.sv"]}}}
+
+    assert _toml.dumps(data) == tomli_w.dumps(data)
+    assert _toml.loads(_toml.dumps(data)) == data
+
+
+def test_loads_reports_decode_error() -> None:
+    """Test malformed documents raise the shim's TOMLDecodeError."""
+    with pytest.raises(_toml.TOMLDecodeError):
+        _toml.loads("[module\nname = ")
@@ -0,0 +1,80 @@
+"""Unit tests for TOML generation from HDL sources."""
+
+from pathlib import Path
+
+import pytest
+
+from asd.core.loader import _default_cache_dir
+from asd.core.repository import Repository
+from asd.generators.toml_gen import TOMLGenerator
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Repository:
+    """Create a repository with a small RTL hierarchy."""
+    monkeypatch.delenv("ASD_NO_CACHE", raising=False)
+    monkeypatch.setenv("ASD_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / ".asd").mkdir()
+    rtl = tmp_path / "rtl"
+    rtl.mkdir()
+    (rtl / "top.sv").write_text(
+        "module top #(parameter WIDTH = 8) (input clk);\n"
+        "  sub_a u_a (.clk(clk));\n"
+        "  sub_b u_b (.clk(clk));\n"
+        "endmodule\n"
+    )
+    leaf = "  leaf_c u_c (.clk(clk));\n"
+    (rtl / "sub_a.sv").write_text(f"module sub_a (input clk);\n{leaf}endmodule\n")
+    (rtl / "sub_b.v").write_text(f"module sub_b (input clk);\n{leaf}endmodule\n")
+    (rtl / "leaf_c.sv").write_text("module leaf_c (input clk);\nendmodule\n")
+    return Repository(root=tmp_path)
+
+
+def test_generate_finds_dependencies_breadth_first(repo: Repository) -> None:
+    """Test each instantiated module is found once, level by level."""
+    config = TOMLGenerator(repo).generate_from_top(Path("rtl/top.sv"))
+
+    assert config.sources.modules == [
+        "rtl/top.sv",
+        "rtl/sub_a.sv",
+        "rtl/sub_b.v",
+        "rtl/leaf_c.sv",
+    ]
+    assert config.parameters["WIDTH"].default == 8
+
+
+def test_dependency_cache_invalidated_by_new_files(repo: Repository) -> None:
+    """Test cached scans are reused until a search directory changes."""
+    TOMLGenerator(repo).generate_from_top(Path("rtl/top.sv"))
+    assert len(list((repo.root / "cache" / "deps").glob("*.json"))) == 1
+
+    config = TOMLGenerator(repo).generate_from_top(Path("rtl/top.sv"))
+    assert config.sources.modules[-1] == "rtl/leaf_c.sv"
+
+    (repo.root / "rtl" / "leaf_c.sv").unlink()
+    (repo.root / "rtl" / "leaf_c.v").write_text("module leaf_c (input clk);\nendmodule\n")
+
+    config = TOMLGenerator(repo).generate_from_top(Path("rtl/top.sv"))
+    assert config.sources.modules[-1] == "rtl/leaf_c.v"
+
+
+def test_dependency_cache_disabled(repo: Repository, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test ASD_NO_CACHE keeps dependency scans off disk."""
+    monkeypatch.setenv("ASD_NO_CACHE", "1")
+    TOMLGenerator(repo).generate_from_top(Path("rtl/top.sv"))
+
+    assert not (repo.root / "cache").exists()
+    monkeypatch.delenv("ASD_NO_CACHE")
+    cache_dir = _default_cache_dir()
+    assert cache_dir is not None
+    assert not (cache_dir / "deps").exists()
+
+
+@pytest.mark.parametrize("entry", [[], {"dirs": {}}, {"dirs": None, "files": {}}, "stale"])
+def test_dependency_cache_malformed_entry_is_a_miss(repo: Repository, entry: object) -> None:
+    """Test a malformed cached scan is ignored and the sources are rescanned."""
+    generator = TOMLGenerator(repo)
+    generator._load_deps_cache()[str(repo.root / "rtl" / "top.sv")] = entry
+
+    config = generator.generate_from_top(Path("rtl/top.sv"))
+    assert config.sources.modules[-1] == "rtl/leaf_c.sv"